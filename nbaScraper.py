@@ -1,18 +1,29 @@
-import requests
+import asyncio
+import random
+import aiohttp
+import orjson
+import requests_cache
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 import pandas as pd
-import time
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
 
 """
 Scrapes all NBA regular-season games for the 2019-2020 season from data.nba.net
-and saves detailed box score data to a CSV file.
+and saves detailed box score data to a Parquet file.
 
 --------------------------------------------------------------------------------
 HOW IT WORKS:
 1) We first hit the SCHEDULE_ENDPOINT to get all game IDs (and dates) for 2019-20.
 2) For each game ID, we build the BOXSCORE_ENDPOINT URL and fetch the boxscore.
-3) We parse the JSON to extract player-level stats, then accumulate in a pandas DataFrame.
-4) Finally, we save everything to 'nba_boxscores_2019_20.csv' locally.
+   Boxscores are fetched concurrently with aiohttp, bounded by MAX_CONCURRENT.
+3) We parse the JSON (with orjson) to extract player-level stats, then stream the rows to Parquet in schedule order
+   as games complete.
+4) Every HTTP response is cached on disk (SQLite), so re-running the script after
+   an interruption only fetches the games that are still missing.
+5) Finally, we save everything to 'nba_boxscores_2019_20.parquet' locally
+   (zstd-compressed; load it with pd.read_parquet).
 
 TIPS:
 - The script can be easily adapted for other seasons by changing "2019" in the URLs.
@@ -26,6 +37,61 @@ SEASON = "2019"  # 2019-20 season
 SCHEDULE_ENDPOINT = f"https://data.nba.net/prod/v2/{SEASON}/schedule.json"
 BOXSCORE_ENDPOINT_TEMPLATE = "https://data.nba.net/prod/v1/{date}/{gameId}_boxscore.json"
 
+# Concurrency / politeness settings for the boxscore requests
+MAX_CONCURRENT = 12
+POLITE_DELAY_RANGE = (0.2, 0.5)  # seconds, slept while holding the semaphore
+REQUEST_TIMEOUT = 30  # seconds per boxscore request; a slow game fails like any other
+MAX_AHEAD = 4 * MAX_CONCURRENT  # games that may be started past the next one to write
+REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
+
+# On-disk response caches (never expire; delete the .sqlite files to re-scrape)
+SCHEDULE_CACHE = "nba_schedule_cache"
+BOXSCORE_CACHE = "nba_boxscore_cache"
+
+# Output column -> key in the boxscore "activePlayers" entries (missing => 0)
+PLAYER_STAT_FIELDS = {
+    "MIN": "min",
+    "PTS": "points",
+    "REB": "totReb",
+    "AST": "assists",
+    "STL": "steals",
+    "BLK": "blocks",
+    "FGM": "fgm",
+    "FGA": "fga",
+    "FG_PCT": "fgp",
+    "FG3M": "tpm",
+    "FG3A": "tpa",
+    "FG3_PCT": "tpp",
+    "FTM": "ftm",
+    "FTA": "fta",
+    "FT_PCT": "ftp",
+    "PLUS_MINUS": "plusMinus",
+    "PF": "pFouls",
+    "TO": "turnovers",
+}
+BOXSCORE_COLUMNS = ["GAME_ID", "GAME_DATE", "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION"] + list(PLAYER_STAT_FIELDS)
+
+# The feed returns stats as strings; numeric ones are cast while parsing
+BOXSCORE_DTYPES = {
+    "PTS": "int32", "REB": "int32", "AST": "int32", "STL": "int32", "BLK": "int32",
+    "FGM": "int32", "FGA": "int32", "FG3M": "int32", "FG3A": "int32",
+    "FTM": "int32", "FTA": "int32", "PLUS_MINUS": "int32", "PF": "int32", "TO": "int32",
+    "FG_PCT": "float32", "FG3_PCT": "float32", "FT_PCT": "float32",
+}
+
+OUT_PARQUET = "nba_boxscores_2019_20.parquet"
+BOXSCORE_SCHEMA = pa.schema([
+    (col, pa.type_for_alias(BOXSCORE_DTYPES.get(col, "string"))) for col in BOXSCORE_COLUMNS
+])
+
+def to_number(value, dtype):
+    """Cast a raw feed value to int/float per BOXSCORE_DTYPES; blanks become 0."""
+    is_float = dtype.startswith("float")
+    try:
+        return float(value) if is_float else int(float(value))
+    except (TypeError, ValueError):
+        return 0.0 if is_float else 0
+
 # -----------------------------------------------------------------------------
 # 2. SCRAPE SCHEDULE FOR GAME IDS
 # -----------------------------------------------------------------------------
@@ -36,22 +102,22 @@ def get_game_ids_for_season(season=SEASON):
     Returns a list of (game_id, yyyymmdd) tuples.
     """
     print(f"[INFO] Fetching schedule for season={season} from data.nba.net...")
-    resp = requests.get(SCHEDULE_ENDPOINT)
+    with requests_cache.CachedSession(SCHEDULE_CACHE) as session:
+        resp = session.get(SCHEDULE_ENDPOINT)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
 
-    # "league" -> "standard" -> list of games
-    all_games = data["league"]["standard"]
+    # "league" -> "standard" -> list of games; only the three keys we need become columns
+    df_games = pd.DataFrame.from_records(
+        data["league"]["standard"], columns=["gameId", "startDateEastern", "seasonStageId"]
+    )
 
-    season_game_ids = []
-    for g in all_games:
-        # Skip if not regular season (could be Preseason or Playoffs in this feed)
-        if g.get("seasonStageId") != 2:  # 2 = Regular Season
-            continue
-
-        game_id = g["gameId"]
-        start_date_eastern = g["startDateEastern"]  # 'YYYYMMDD' string
-        season_game_ids.append((game_id, start_date_eastern))
+    # Keep only regular season (could be Preseason or Playoffs in this feed)
+    mask = df_games["seasonStageId"].to_numpy() == 2  # 2 = Regular Season
+    season_game_ids = list(zip(
+        df_games.loc[mask, "gameId"],
+        df_games.loc[mask, "startDateEastern"],  # 'YYYYMMDD' string
+    ))
 
     print(f"[INFO] Found {len(season_game_ids)} REGULAR SEASON games for {season}-{int(season)+1}.")
     return season_game_ids
@@ -59,16 +125,29 @@ def get_game_ids_for_season(season=SEASON):
 # -----------------------------------------------------------------------------
 # 3. SCRAPE BOXSCORE FOR EACH GAME
 # -----------------------------------------------------------------------------
-def scrape_boxscore(game_id, yyyymmdd):
+async def fetch(session, sem, game_id, yyyymmdd):
     """
-    Given a game_id and the yyyymmdd date string, build the boxscore endpoint URL,
-    request the JSON data, and parse player stats into a Pandas DataFrame.
-    Returns a DataFrame with all players' stats for that game.
+    Fetch the boxscore JSON for one game. The semaphore bounds how many
+    requests are in flight; a short random sleep inside it keeps us polite.
+    Responses served from the on-disk cache skip the sleep.
     """
     url = BOXSCORE_ENDPOINT_TEMPLATE.format(date=yyyymmdd, gameId=game_id)
-    resp = requests.get(url)
-    resp.raise_for_status()
-    data = resp.json()
+    async with sem:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            data = orjson.loads(await resp.read())
+            from_cache = getattr(resp, "from_cache", False)
+        if not from_cache:
+            await asyncio.sleep(random.uniform(*POLITE_DELAY_RANGE))
+    return data
+
+async def scrape_boxscore(session, sem, game_id, yyyymmdd):
+    """
+    Given a game_id and the yyyymmdd date string, fetch the boxscore JSON
+    and parse player stats into plain row dicts.
+    Returns a list of rows (one per player), or an empty list if there's no data.
+    """
+    data = await fetch(session, sem, game_id, yyyymmdd)
 
     # data["stats"] -> "activePlayers" holds a list of dicts with player stats
     # If it's an unfinished or postponed game, it might be empty or missing.
@@ -77,9 +156,9 @@ def scrape_boxscore(game_id, yyyymmdd):
 
     if not players:
         # Could be a canceled/postponed game
-        return pd.DataFrame()
+        return []
 
-    # We'll store the full row data
+    # We'll store the full row data; main() writes it straight to Parquet
     rows = []
     for p in players:
         row = {
@@ -89,65 +168,92 @@ def scrape_boxscore(game_id, yyyymmdd):
             "PLAYER_NAME": p.get("firstName") + " " + p.get("familyName"),
             "TEAM_ID": p.get("teamId"),
             "TEAM_ABBREVIATION": p.get("teamTricode"),
-            "MIN": p.get("min", 0),
-            "PTS": p.get("points", 0),
-            "REB": p.get("totReb", 0),
-            "AST": p.get("assists", 0),
-            "STL": p.get("steals", 0),
-            "BLK": p.get("blocks", 0),
-            "FGM": p.get("fgm", 0),
-            "FGA": p.get("fga", 0),
-            "FG_PCT": p.get("fgp", 0),
-            "FG3M": p.get("tpm", 0),
-            "FG3A": p.get("tpa", 0),
-            "FG3_PCT": p.get("tpp", 0),
-            "FTM": p.get("ftm", 0),
-            "FTA": p.get("fta", 0),
-            "FT_PCT": p.get("ftp", 0),
-            "PLUS_MINUS": p.get("plusMinus", 0),
-            "PF": p.get("pFouls", 0),
-            "TO": p.get("turnovers", 0),
         }
+        for col, key in PLAYER_STAT_FIELDS.items():
+            row[col] = p.get(key, 0)
+        # Numeric columns are cast per BOXSCORE_DTYPES; the rest must be strings
+        # for BOXSCORE_SCHEMA (e.g. a missing "min" defaults to 0 above)
+        for col, value in row.items():
+            if col in BOXSCORE_DTYPES:
+                row[col] = to_number(value, BOXSCORE_DTYPES[col])
+            elif value is not None:
+                row[col] = str(value)
         rows.append(row)
 
-    df = pd.DataFrame(rows)
-    return df
+    return rows
+
+async def scrape_game(session, sem, idx, game_id, yyyymmdd):
+    """
+    Wrapper around scrape_boxscore for use with asyncio.wait.
+    Returns (idx, rows), where idx is the game's position in the schedule;
+    rows is the exception if the game failed.
+    """
+    try:
+        rows = await scrape_boxscore(session, sem, game_id, yyyymmdd)
+    except Exception as exc:
+        rows = exc
+    return idx, rows
 
 # -----------------------------------------------------------------------------
 # 4. MAIN SCRIPT
 # -----------------------------------------------------------------------------
-def main():
+async def main():
     # A) Get all game IDs
     season_game_ids = get_game_ids_for_season(season=SEASON)
+    total = len(season_game_ids)
 
-    # Prepare a list to accumulate DataFrames for each game
-    all_game_dfs = []
+    # B) Open the output Parquet file once; games are written as soon as every
+    #    earlier game in the schedule is done, so the file stays in schedule order.
+    #    At most MAX_AHEAD games are started past the next one to write, so a slow
+    #    game can't leave the rest of the season parked in `pending`.
+    row_count = 0
+    pending = {}   # schedule index -> rows, for games that finished early
+    next_idx = 0   # next schedule index to write
+    started = 0    # games scheduled so far
+    in_flight = set()
+    with pq.ParquetWriter(OUT_PARQUET, BOXSCORE_SCHEMA, compression="zstd") as writer:
+        # C) Scrape the boxscores concurrently (bounded by the semaphore)
+        sem = asyncio.Semaphore(MAX_CONCURRENT)
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        cache = SQLiteBackend(BOXSCORE_CACHE)
+        async with CachedSession(cache=cache, headers=REQUEST_HEADERS, connector=connector,
+                                 timeout=timeout) as session:
+            while next_idx < total:
+                while started < min(total, next_idx + MAX_AHEAD):
+                    game_id, date_str = season_game_ids[started]
+                    in_flight.add(asyncio.ensure_future(
+                        scrape_game(session, sem, started, game_id, date_str)))
+                    started += 1
 
-    # B) Iterate and scrape
-    for idx, (game_id, date_str) in enumerate(season_game_ids, start=1):
-        print(f"[SCRAPE] [{idx}/{len(season_game_ids)}] GameID={game_id} Date={date_str}")
-        game_df = scrape_boxscore(game_id, date_str)
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    idx, rows = task.result()
+                    pending[idx] = rows
 
-        # Only append if there's data
-        if not game_df.empty:
-            all_game_dfs.append(game_df)
+                # Flush the finished prefix of the schedule, in order
+                while next_idx in pending:
+                    rows = pending.pop(next_idx)
+                    game_id, date_str = season_game_ids[next_idx]
+                    next_idx += 1
+                    if isinstance(rows, Exception):
+                        print(f"[WARNING] [{next_idx}/{total}] GameID={game_id} Date={date_str} failed: {rows!r}")
+                        continue
+                    if rows:
+                        try:
+                            writer.write_table(pa.Table.from_pylist(rows, schema=BOXSCORE_SCHEMA))
+                        except (pa.ArrowException, TypeError, ValueError) as exc:
+                            # Skip a game that doesn't fit the schema, same as a failed fetch
+                            print(f"[WARNING] [{next_idx}/{total}] GameID={game_id} Date={date_str} write failed: {exc}")
+                            continue
+                    print(f"[SCRAPE] [{next_idx}/{total}] GameID={game_id} Date={date_str} rows={len(rows)}")
+                    row_count += len(rows)
 
-        # Sleep briefly to be polite, reduce the risk of rate limiting
-        time.sleep(0.6)
-
-    # C) Combine all games into one DataFrame
-    if all_game_dfs:
-        final_df = pd.concat(all_game_dfs, ignore_index=True)
-    else:
+    if row_count == 0:
         print("[WARNING] No data scraped. Possibly no valid regular-season games found.")
-        final_df = pd.DataFrame()
-
-    # D) Save to CSV
-    out_csv = "nba_boxscores_2019_20.csv"
-    final_df.to_csv(out_csv, index=False)
-    print(f"[DONE] Saved {len(final_df)} player-boxscore rows to '{out_csv}'.")
+    print(f"[DONE] Saved {row_count} player-boxscore rows to '{OUT_PARQUET}'.")
 
 if __name__ == "__main__":
     # Create an output folder if desired
     # os.makedirs("scraped_data", exist_ok=True)
-    main()
+    asyncio.run(main())
@@ -1,9 +1,12 @@
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings("ignore")
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 ###############################################################################
 # 1) FILE PATHS - ADJUST IF NEEDED
@@ -14,22 +17,146 @@ REG_BOX_PART3 = r"C:\Users\sskub\OneDrive\Desktop\betting\regular_season_box_sco
 
 TEAM_TOT_CSV   = r"C:\Users\sskub\OneDrive\Desktop\betting\regular_season_totals_2010_2024.csv"
 
+# Only the columns used downstream are parsed, with their dtypes given up front
+PLAYER_DTYPES = {
+    "season_year": "string[pyarrow]",
+    "matchup": "string",
+    "gameId": "int64",
+    "teamId": "int64",
+    "personId": "int64",
+    "minutes": "string",
+}
+PLAYER_STATS = [
+    "fieldGoalsMade", "fieldGoalsAttempted", "fieldGoalsPercentage",
+    "threePointersMade", "threePointersAttempted", "threePointersPercentage",
+    "freeThrowsMade", "freeThrowsAttempted", "freeThrowsPercentage",
+    "reboundsOffensive", "reboundsDefensive", "reboundsTotal",
+    "assists", "steals", "blocks", "turnovers", "foulsPersonal",
+    "points", "plusMinusPoints",
+]
+PLAYER_USECOLS = list(PLAYER_DTYPES) + ["game_date"] + PLAYER_STATS
+
+TEAM_DTYPES = {
+    "SEASON_YEAR": "string[pyarrow]",
+    "TEAM_ID": "int64",
+    "TEAM_ABBREVIATION": "string",
+    "GAME_ID": "int64",
+    "MATCHUP": "string",
+    "WL": "string",
+}
+TEAM_STATS = [
+    "MIN", "FGM", "FGA", "FG_PCT", "FG3M", "FG3A", "FG3_PCT", "FTM", "FTA", "FT_PCT",
+    "OREB", "DREB", "REB", "AST", "TOV", "STL", "BLK", "BLKA", "PF", "PFD", "PTS", "PLUS_MINUS",
+]
+TEAM_USECOLS = list(TEAM_DTYPES) + ["GAME_DATE"] + TEAM_STATS
+
+CSV_CHUNKSIZE = 1_000_000
+
+def read_chunks(csv_path, usecols=None, dtype=None):
+    """
+    Yield one of the data files as DataFrame chunks, preferring a Parquet copy
+    next to the CSV. The first load parses the CSV chunk by chunk and writes
+    each chunk into that copy (zstd), so later runs skip CSV parsing entirely.
+    The copy records the CSV's size and mtime; if either no longer matches, or
+    the copy is missing some of the requested columns, the CSV is re-read.
+    """
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    source = csv_signature(csv_path)
+    schema = None
+    if os.path.exists(parquet_path):
+        try:
+            schema = pq.read_schema(parquet_path)
+        except (OSError, pa.ArrowException):
+            pass
+    if schema is not None and all((schema.metadata or {}).get(k) == v for k, v in source.items()):
+        names = schema.names
+        if usecols is None or set(usecols) <= set(names):
+            # Keep the file's column order, same as read_csv(usecols=...)
+            columns = None if usecols is None else [c for c in names if c in usecols]
+            for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=CSV_CHUNKSIZE, columns=columns):
+                yield batch.to_pandas()
+            return
+
+    # Write to a temp file and only swap it in once the whole CSV has been read.
+    # The copy is best effort: if it can't be written, plain CSV chunks are still yielded.
+    tmp_path = parquet_path + ".tmp"
+    writer = None
+    for chunk in pd.read_csv(csv_path, usecols=usecols, dtype=dtype, engine="c",
+                             chunksize=CSV_CHUNKSIZE, low_memory=True):
+        if writer is not False:
+            try:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    schema = table.schema.with_metadata({**(table.schema.metadata or {}), **source})
+                    writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+                writer.write_table(table.cast(writer.schema))
+            except (OSError, pa.ArrowException, ValueError):
+                # Read-only directory, a mixed-type object column, or a later
+                # chunk's inferred types don't fit the first one's; skip the copy
+                discard_parquet_copy(writer, tmp_path)
+                writer = False
+        yield chunk
+
+    if writer:
+        try:
+            writer.close()
+            os.replace(tmp_path, parquet_path)
+        except OSError:
+            discard_parquet_copy(None, tmp_path)
+
+def csv_signature(csv_path):
+    """Size and mtime of a CSV, as stored in its Parquet copy's schema metadata."""
+    st = os.stat(csv_path)
+    return {b"source_size": str(st.st_size).encode(), b"source_mtime_ns": str(st.st_mtime_ns).encode()}
+
+def discard_parquet_copy(writer, tmp_path):
+    """Close and remove a half-written Parquet copy, ignoring filesystem errors."""
+    try:
+        if writer:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    except OSError:
+        pass
+
+def filter_season_years(chunk, col, start_year=None, end_year=None):
+    """
+    Turn a 'YYYY-YY' season column into an int32 year and keep only the rows
+    inside [start_year, end_year] (either bound may be None). Applied to each
+    chunk as it is read, so out-of-range rows never reach the concat.
+    """
+    values = chunk[col]
+    if pd.api.types.is_numeric_dtype(values):
+        # Already numeric: plain years pass through, 20192020-style values become 2019
+        years = values.where(values < 10000, values // 10000)
+    else:
+        # Vectorized slice on the (pyarrow-backed) strings, no Python str round-trip
+        years = pd.to_numeric(values.str.slice(0, 4), errors="coerce")
+    keep = years.notna()
+    if start_year is not None:
+        keep &= years >= start_year
+    if end_year is not None:
+        keep &= years <= end_year
+    return chunk.loc[keep].assign(**{col: years[keep].astype("int32")})
+
 ###############################################################################
 # 2) LOADING PARTIAL PLAYER BOX SCORES
 ###############################################################################
-def load_player_box_scores():
+def load_player_box_scores(start_year=None, end_year=None):
     print("[INFO] Loading partial CSVs for PLAYER box scores...")
-    df_p1 = pd.read_csv(REG_BOX_PART1)
-    df_p2 = pd.read_csv(REG_BOX_PART2)
-    df_p3 = pd.read_csv(REG_BOX_PART3)
+    def read_part(path):
+        return [
+            filter_season_years(chunk, "season_year", start_year, end_year)
+            for chunk in read_chunks(path, usecols=PLAYER_USECOLS, dtype=PLAYER_DTYPES)
+        ]
 
-    df = pd.concat([df_p1, df_p2, df_p3], ignore_index=True)
-    
-    # Clean up season_year
-    df["season_year"] = df["season_year"].astype(str).str[:4]
-    df["season_year"] = pd.to_numeric(df["season_year"], errors="coerce")
-    df.dropna(subset=["season_year"], inplace=True)
-    df["season_year"] = df["season_year"].astype(int)
+    # The three files are independent and pandas/pyarrow parse them with the GIL
+    # released, so read them in parallel; then concatenate all chunks exactly once
+    parts = [REG_BOX_PART1, REG_BOX_PART2, REG_BOX_PART3]
+    with ThreadPoolExecutor(max_workers=len(parts)) as ex:
+        chunks = [chunk for part_chunks in ex.map(read_part, parts) for chunk in part_chunks]
+
+    df = pd.concat(chunks, ignore_index=True)
 
     # Convert game_date
     df["game_date"] = pd.to_datetime(df["game_date"], errors="coerce")
@@ -45,218 +172,231 @@ def load_player_box_scores():
 ###############################################################################
 # 3) LOADING TEAM TOTALS (2 rows per game)
 ###############################################################################
-def load_team_totals():
+def load_team_totals(start_year=None, end_year=None):
     print("[INFO] Loading CSV for team totals (two rows per game).")
-    df = pd.read_csv(TEAM_TOT_CSV)
-
-    df["SEASON_YEAR"] = df["SEASON_YEAR"].astype(str).str[:4]
-    df["SEASON_YEAR"] = pd.to_numeric(df["SEASON_YEAR"], errors="coerce")
-    df.dropna(subset=["SEASON_YEAR"], inplace=True)
-    df["SEASON_YEAR"] = df["SEASON_YEAR"].astype(int)
+    chunks = [
+        filter_season_years(chunk, "SEASON_YEAR", start_year, end_year)
+        for chunk in read_chunks(TEAM_TOT_CSV, usecols=TEAM_USECOLS, dtype=TEAM_DTYPES)
+    ]
+    df = pd.concat(chunks, ignore_index=True)
 
     df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], errors="coerce")
-    df["MATCHUP"] = df["MATCHUP"].astype(str).fillna("")
+
+    # Parse home/away once: "vs." in MATCHUP means home, "@" (or missing) means away.
+    # MATCHUP itself isn't needed after that, so it is dropped.
+    df["IS_HOME"] = df["MATCHUP"].str.contains("vs.", regex=False).fillna(False).astype("int8")
+    df.drop(columns="MATCHUP", inplace=True)
 
     # We assume there's a "WL" column for each row to indicate if that row's team won or lost.
 
+    # Low-cardinality strings as category: comparisons/isin work on small int codes.
+    # Cast after the concat, since chunks with different categories would fall back to object.
+    for col in ["TEAM_ABBREVIATION", "WL"]:
+        df[col] = df[col].astype("category")
+
     df.sort_values(by=["GAME_ID", "TEAM_ID"], inplace=True)
     df.reset_index(drop=True, inplace=True)
     print(f"[INFO] Team totals shape: {df.shape}")
     return df
 
 ###############################################################################
-# 4) FILTER YEAR RANGE
+# 4) FILTER YEAR RANGE (for frames loaded without a year range)
 ###############################################################################
 def filter_year_range_player(df, start_year, end_year):
-    return df[(df["season_year"] >= start_year) & (df["season_year"] <= end_year)].copy()
+    return df[(df["season_year"] >= start_year) & (df["season_year"] <= end_year)]
 
 def filter_year_range_team(df, start_year, end_year):
-    return df[(df["SEASON_YEAR"] >= start_year) & (df["SEASON_YEAR"] <= end_year)].copy()
+    return df[(df["SEASON_YEAR"] >= start_year) & (df["SEASON_YEAR"] <= end_year)]
 
 ###############################################################################
-# 5) MAIN SCRIPT
+# 5) TEAM MATCHUP ANALYSIS
 ###############################################################################
-def main():
-    mode = input("Enter mode: 'PLAYER' or 'TEAM': ").strip().upper()
-    if mode not in ["PLAYER", "TEAM"]:
-        print("[ERROR] Invalid mode. Please enter 'PLAYER' or 'TEAM'.")
-        return
-
+def prompt_team_query():
+    """
+    Ask for one TEAM-mode query. Returns (teamA, teamB, start_year, end_year, ou_line),
+    or None if the input was invalid.
+    """
     # Year range
     try:
         start_year = int(input("Enter start year (e.g., 2015): "))
         end_year   = int(input("Enter end year   (e.g., 2024): "))
     except ValueError:
         print("[ERROR] Invalid years. Please enter numeric values for years.")
-        return
+        return None
 
     # Over/Under line
     try:
         ou_line = float(input("Enter Over/Under line (e.g. 220.5): "))
     except ValueError:
         print("[ERROR] Invalid Over/Under line. Please enter a numeric value.")
+        return None
+
+    # Team abbreviations
+    teamA = input("Enter your team abbreviation (e.g. CLE): ").strip().upper()
+    teamB = input("Enter opponent team abbreviation (e.g. GSW): ").strip().upper()
+    return teamA, teamB, start_year, end_year, ou_line
+
+def analyze_matchup(team_idx, teamA, teamB, start_year, end_year, ou_line):
+    """
+    Print the head-to-head summary and betting recommendations for one query.
+    team_idx is the team totals loaded once by main(), indexed by
+    (TEAM_ABBREVIATION, GAME_ID); it is only looked up and filtered here.
+    """
+    # 1) Filter for games between teamA and teamB
+    # Look up the two teams' rows in the sorted index (no full-column scan),
+    # restrict them to the year range, then keep GAME_IDs where both teams appear
+    teams = [team for team in (teamA, teamB) if team in team_idx.index.levels[0]]
+    df_pair = team_idx.loc[teams].reset_index()
+    df_pair = filter_year_range_team(df_pair, start_year, end_year)
+    teams_per_game = df_pair.groupby("GAME_ID")["TEAM_ABBREVIATION"].nunique()
+    common_game_ids = teams_per_game.index[teams_per_game == 2]
+
+    if common_game_ids.empty:
+        print(f"[ERROR] No games found between '{teamA}' and '{teamB}' from {start_year} to {end_year}.")
         return
 
-    if mode == "PLAYER":
-        # PLAYER mode implementation (unchanged)
-        # [Code omitted for brevity; refer to previous versions]
-        print("[INFO] PLAYER mode is not modified in this iteration.")
-        return  # Exit as focus is on TEAM mode
-
+    # Extract the rows for these games (one for teamA, one for teamB)
+    df_matchups = df_pair[df_pair["GAME_ID"].isin(common_game_ids)]
+
+    # Sum the total points per game. No re-sort needed: df_pair is in (team, game) order,
+    # and the first team's block is GAME_ID-sorted and contains every common game
+    grouped = df_matchups.groupby("GAME_ID", as_index=False, sort=False).agg(
+        game_total_points=("PTS", "sum"),
+        SEASON_YEAR=("SEASON_YEAR", "first"),  # Assuming SEASON_YEAR is the same for both teams in a game
+    )
+
+    # Determine Over or Under
+    is_over = grouped["game_total_points"].to_numpy() > ou_line
+    grouped["Over/Under"] = np.where(is_over, "Over", "Under")
+    over_count = is_over.sum()
+    total_count = len(grouped)
+    prob_over = over_count / total_count if total_count > 0 else 0.0
+
+    # Determine winners and home/away status from teamA's row of each game
+    teamA_rows = df_matchups[df_matchups["TEAM_ABBREVIATION"] == teamA].drop_duplicates("GAME_ID").set_index("GAME_ID")
+    teamA_row_won = teamA_rows["WL"].eq("W").to_numpy(dtype=bool, na_value=False)
+    teamA_row_home = teamA_rows["IS_HOME"].to_numpy() == 1
+    outcomes = pd.DataFrame({
+        "Winner": np.where(teamA_row_won, teamA, teamB),
+        "Location": np.where(teamA_row_home, "Home", "Away"),
+        "Season_Year": teamA_rows["SEASON_YEAR"],
+    }, index=teamA_rows.index)
+    grouped = grouped.join(outcomes, on="GAME_ID")
+
+    # Calculate home and away wins for each team in a single pass:
+    # code = 2 * (teamB won) + (away), so bincount gives [A home, A away, B home, B away]
+    teamB_won = grouped["Winner"].to_numpy() == teamB
+    is_away = grouped["Location"].to_numpy() == "Away"
+    win_codes = 2 * teamB_won.astype(np.int8) + is_away.astype(np.int8)
+    home_wins_teamA, away_wins_teamA, home_wins_teamB, away_wins_teamB = np.bincount(win_codes, minlength=4)
+
+    # Calculate win counts
+    teamA_wins = home_wins_teamA + away_wins_teamA
+    teamB_wins = home_wins_teamB + away_wins_teamB
+
+    # Display summary
+    print(f"\n=== TEAM MATCHUP: {teamA} vs {teamB} in {start_year}-{end_year} ===")
+    print(f"Total games analyzed: {total_count}")
+    print(f"Times Over {ou_line}: {over_count} => Over Probability: {prob_over:.3f}\n")
+
+    print(f"Win Statistics:")
+    print(f"{teamA} Wins: {teamA_wins} ({teamA_wins / total_count:.3f} probability)")
+    print(f"{teamB} Wins: {teamB_wins} ({teamB_wins / total_count:.3f} probability)\n")
+
+    print(f"Home/Away Win Breakdown:")
+    print(f"{teamA} Home Wins: {home_wins_teamA}")
+    print(f"{teamA} Away Wins: {away_wins_teamA}\n")
+    print(f"{teamB} Home Wins: {home_wins_teamB}")
+    print(f"{teamB} Away Wins: {away_wins_teamB}\n")
+
+    # Provide betting recommendations
+    print(f"=== Betting Recommendations ===")
+    
+    # Recommendation for Over/Under
+    if prob_over > 0.6:
+        ou_recommendation = "Over"
+        ou_confidence = "strong"
+    elif prob_over > 0.5:
+        ou_recommendation = "Over"
+        ou_confidence = "moderate"
+    elif prob_over < 0.4:
+        ou_recommendation = "Under"
+        ou_confidence = "strong"
+    elif prob_over < 0.5:
+        ou_recommendation = "Under"
+        ou_confidence = "moderate"
     else:
-        # mode == "TEAM"
-        # 1) Load team totals
-        df_team = load_team_totals()
-        df_team = filter_year_range_team(df_team, start_year, end_year)
-        if df_team.empty:
-            print(f"[ERROR] No team data from {start_year}-{end_year}.")
-            return
+        ou_recommendation = "Neutral"
+        ou_confidence = "no clear trend"
 
-        # 2) Ask for the team abbreviations
-        teamA = input("Enter your team abbreviation (e.g. CLE): ").strip().upper()
-        teamB = input("Enter opponent team abbreviation (e.g. GSW): ").strip().upper()
+    if ou_recommendation != "Neutral":
+        print(f"- The probability of the game going Over {ou_line} is {prob_over:.2f}. It's recommended to bet on **{ou_recommendation}** with {ou_confidence} confidence.")
+    else:
+        print(f"- The Over/Under probability is {prob_over:.2f}. It's recommended to **hold** your bet as there's no clear trend.")
+
+    # Recommendation for Winning Team
+    if teamA_wins / total_count > teamB_wins / total_count + 0.1:
+        win_recommendation = teamA
+        win_confidence = "high"
+    elif teamB_wins / total_count > teamA_wins / total_count + 0.1:
+        win_recommendation = teamB
+        win_confidence = "high"
+    elif teamA_wins / total_count > teamB_wins / total_count + 0.05:
+        win_recommendation = teamA
+        win_confidence = "moderate"
+    elif teamB_wins / total_count > teamA_wins / total_count + 0.05:
+        win_recommendation = teamB
+        win_confidence = "moderate"
+    else:
+        win_recommendation = "Neither team has a clear advantage"
+        win_confidence = "low"
 
-        # 3) Filter for games between teamA and teamB
-        # Find GAME_IDs where both teamA and teamB participated
-        games_teamA = set(df_team[df_team["TEAM_ABBREVIATION"] == teamA]["GAME_ID"])
-        games_teamB = set(df_team[df_team["TEAM_ABBREVIATION"] == teamB]["GAME_ID"])
-        common_game_ids = games_teamA.intersection(games_teamB)
+    if win_recommendation in [teamA, teamB]:
+        print(f"- Based on historical performance, it's recommended to bet on **{win_recommendation}** to win with {win_confidence} confidence.")
+    else:
+        print(f"- Based on historical performance, there's no clear advantage. It's recommended to **consider other factors** before placing a bet.")
+
+    # Optional: Display detailed game results
+    show_details = input("Do you want to see detailed game results? (yes/no): ").strip().lower()
+    if show_details in ['yes', 'y']:
+        detailed_results = grouped[['GAME_ID', 'Season_Year', 'game_total_points', 'Over/Under', 'Winner', 'Location']]
+        detailed_results.rename(columns={
+            'game_total_points': 'Total_Points',
+            'Location': 'Home/Away',
+            'Season_Year': 'Year'
+        }, inplace=True)
+        print("\n=== Detailed Game Results ===")
+        print(detailed_results.to_string(index=False))
 
-        if not common_game_ids:
-            print(f"[ERROR] No games found between '{teamA}' and '{teamB}' from {start_year} to {end_year}.")
-            return
+###############################################################################
+# 6) MAIN SCRIPT
+###############################################################################
+def main():
+    mode = input("Enter mode: 'PLAYER' or 'TEAM': ").strip().upper()
+    if mode not in ["PLAYER", "TEAM"]:
+        print("[ERROR] Invalid mode. Please enter 'PLAYER' or 'TEAM'.")
+        return
 
-        # Extract the rows for these games
-        df_matchups = df_team[df_team["GAME_ID"].isin(common_game_ids)].copy()
+    if mode == "PLAYER":
+        # PLAYER mode implementation (unchanged)
+        # [Code omitted for brevity; refer to previous versions]
+        print("[INFO] PLAYER mode is not modified in this iteration.")
+        return  # Exit as focus is on TEAM mode
 
-        # Ensure that each GAME_ID has exactly two entries (teamA and teamB)
-        df_matchups = df_matchups.groupby("GAME_ID").filter(lambda x: set(x["TEAM_ABBREVIATION"]) == {teamA, teamB})
+    # mode == "TEAM"
+    # Load team totals once (all seasons) and reuse them for every query. They are
+    # indexed by (team, game) right away, so each query's team lookup is a
+    # sorted-index search and no unindexed copy stays alive next to the index.
+    team_idx = load_team_totals().set_index(["TEAM_ABBREVIATION", "GAME_ID"]).sort_index()
 
-        if df_matchups.empty:
-            print(f"[ERROR] No valid matchups found between '{teamA}' and '{teamB}' from {start_year} to {end_year}.")
-            return
+    while True:
+        query = prompt_team_query()
+        if query is not None:
+            analyze_matchup(team_idx, *query)
 
-        # Sum the total points per game
-        grouped = df_matchups.groupby("GAME_ID", as_index=False).agg({
-            "PTS": "sum",
-            "SEASON_YEAR": "first",  # Assuming SEASON_YEAR is the same for both teams in a game
-            "MATCHUP": lambda x: list(x)
-        })
-        grouped.rename(columns={"PTS":"game_total_points", "MATCHUP": "matchups"}, inplace=True)
-
-        # Determine Over or Under
-        grouped["Over/Under"] = grouped["game_total_points"].apply(lambda x: "Over" if x > ou_line else "Under")
-        over_count = (grouped["Over/Under"] == "Over").sum()
-        total_count = len(grouped)
-        prob_over = over_count / total_count if total_count > 0 else 0.0
-
-        # Determine winners and home/away status
-        def determine_winner_and_location(row):
-            team_rows = df_matchups[df_matchups["GAME_ID"] == row["GAME_ID"]]
-            teamA_row = team_rows[team_rows["TEAM_ABBREVIATION"] == teamA].iloc[0]
-            teamB_row = team_rows[team_rows["TEAM_ABBREVIATION"] == teamB].iloc[0]
-
-            # Determine who won
-            winner = teamA if teamA_row["WL"] == "W" else teamB
-
-            # Determine home/away
-            # If "vs." in teamA's matchup, they are home; "@" means away
-            if "vs." in teamA_row["MATCHUP"]:
-                location = "Home"
-            else:
-                location = "Away"
-
-            # Retrieve SEASON_YEAR
-            season_year = teamA_row["SEASON_YEAR"]
-
-            return pd.Series([winner, location, season_year])
-
-        grouped[['Winner', 'Location', 'Season_Year']] = grouped.apply(determine_winner_and_location, axis=1)
-
-        # Calculate win counts
-        teamA_wins = (grouped["Winner"] == teamA).sum()
-        teamB_wins = (grouped["Winner"] == teamB).sum()
-
-        # Calculate home and away wins for each team
-        home_wins_teamA = ((grouped["Winner"] == teamA) & (grouped["Location"] == "Home")).sum()
-        away_wins_teamA = ((grouped["Winner"] == teamA) & (grouped["Location"] == "Away")).sum()
-
-        home_wins_teamB = ((grouped["Winner"] == teamB) & (grouped["Location"] == "Home")).sum()
-        away_wins_teamB = ((grouped["Winner"] == teamB) & (grouped["Location"] == "Away")).sum()
-
-        # Display summary
-        print(f"\n=== TEAM MATCHUP: {teamA} vs {teamB} in {start_year}-{end_year} ===")
-        print(f"Total games analyzed: {total_count}")
-        print(f"Times Over {ou_line}: {over_count} => Over Probability: {prob_over:.3f}\n")
-
-        print(f"Win Statistics:")
-        print(f"{teamA} Wins: {teamA_wins} ({teamA_wins / total_count:.3f} probability)")
-        print(f"{teamB} Wins: {teamB_wins} ({teamB_wins / total_count:.3f} probability)\n")
-
-        print(f"Home/Away Win Breakdown:")
-        print(f"{teamA} Home Wins: {home_wins_teamA}")
-        print(f"{teamA} Away Wins: {away_wins_teamA}\n")
-        print(f"{teamB} Home Wins: {home_wins_teamB}")
-        print(f"{teamB} Away Wins: {away_wins_teamB}\n")
-
-        # Provide betting recommendations
-        print(f"=== Betting Recommendations ===")
-        
-        # Recommendation for Over/Under
-        if prob_over > 0.6:
-            ou_recommendation = "Over"
-            ou_confidence = "strong"
-        elif prob_over > 0.5:
-            ou_recommendation = "Over"
-            ou_confidence = "moderate"
-        elif prob_over < 0.4:
-            ou_recommendation = "Under"
-            ou_confidence = "strong"
-        elif prob_over < 0.5:
-            ou_recommendation = "Under"
-            ou_confidence = "moderate"
-        else:
-            ou_recommendation = "Neutral"
-            ou_confidence = "no clear trend"
-
-        if ou_recommendation != "Neutral":
-            print(f"- The probability of the game going Over {ou_line} is {prob_over:.2f}. It's recommended to bet on **{ou_recommendation}** with {ou_confidence} confidence.")
-        else:
-            print(f"- The Over/Under probability is {prob_over:.2f}. It's recommended to **hold** your bet as there's no clear trend.")
-
-        # Recommendation for Winning Team
-        if teamA_wins / total_count > teamB_wins / total_count + 0.1:
-            win_recommendation = teamA
-            win_confidence = "high"
-        elif teamB_wins / total_count > teamA_wins / total_count + 0.1:
-            win_recommendation = teamB
-            win_confidence = "high"
-        elif teamA_wins / total_count > teamB_wins / total_count + 0.05:
-            win_recommendation = teamA
-            win_confidence = "moderate"
-        elif teamB_wins / total_count > teamA_wins / total_count + 0.05:
-            win_recommendation = teamB
-            win_confidence = "moderate"
-        else:
-            win_recommendation = "Neither team has a clear advantage"
-            win_confidence = "low"
-
-        if win_recommendation in [teamA, teamB]:
-            print(f"- Based on historical performance, it's recommended to bet on **{win_recommendation}** to win with {win_confidence} confidence.")
-        else:
-            print(f"- Based on historical performance, there's no clear advantage. It's recommended to **consider other factors** before placing a bet.")
-
-        # Optional: Display detailed game results
-        show_details = input("Do you want to see detailed game results? (yes/no): ").strip().lower()
-        if show_details in ['yes', 'y']:
-            detailed_results = grouped[['GAME_ID', 'Season_Year', 'game_total_points', 'Over/Under', 'Winner', 'Location']]
-            detailed_results.rename(columns={
-                'game_total_points': 'Total_Points',
-                'Location': 'Home/Away',
-                'Season_Year': 'Year'
-            }, inplace=True)
-            print("\n=== Detailed Game Results ===")
-            print(detailed_results.to_string(index=False))
+        again = input("Analyze another matchup? (yes/no): ").strip().lower()
+        if again not in ['yes', 'y']:
+            break
 
 if __name__ == "__main__":
     main()